@@ -7,13 +7,32 @@ for accessing SEC filings, earnings transcripts, and company data.
 Note: This API requires authentication via session cookies from capedge.com.
 """
 
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
 import requests
-from typing import Optional, Dict, List, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, List, Any, Tuple, Iterable, Iterator
 from dataclasses import dataclass
-from urllib.parse import urljoin
+from operator import itemgetter
+from urllib.parse import urlencode
+from html.parser import HTMLParser
 
 
-@dataclass
+# name=value pairs in a Cookie header, separated by ";"
+_COOKIE_RE = re.compile(r"([^=;\s]+)=([^;]*?)\s*(?=;|$)")
+
+# Required keys of a transcript list item, in Transcript field order
+_TRANSCRIPT_FIELDS = itemgetter("id", "company", "year", "quarter", "title", "date", "transcriptUrl")
+
+
+@dataclass(slots=True, frozen=True)
 class Transcript:
     """Earnings call transcript metadata."""
     id: str
@@ -29,7 +48,7 @@ class Transcript:
     market_cap: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Company:
     """Company search result."""
     cik: str
@@ -37,6 +56,220 @@ class Company:
     ticker: Optional[str] = None
 
 
+class TranscriptParser(HTMLParser):
+    """
+    Parser for transcript pages.
+
+    Walks the speaker grid (div.r6o-annotatable > div.grid) as the HTML is
+    tokenized, without building a document tree. Each speaker heading (h3)
+    becomes a (speaker, paragraphs) entry in `sections`, with the text of
+    every <p> in the content div that follows it.
+
+    The page can be fed in chunks as it downloads; read_sections() returns
+    the sections completed so far.
+
+    Usage:
+        parser = TranscriptParser()
+        parser.feed(html_content)
+        parser.close()
+        for speaker, paragraphs in parser.sections:
+            ...
+    """
+
+    # Elements that never have a closing tag
+    VOID_TAGS = frozenset({
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "source", "track", "wbr",
+    })
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.sections: List[Tuple[str, List[str]]] = []
+        self._stack: List[str] = []
+        self._annotatable_depth: Optional[int] = None
+        self._grid_depth: Optional[int] = None
+        self._content_depth: Optional[int] = None
+        self._expect_content = False
+        self._capture_tag: Optional[str] = None
+        self._capture_depth: Optional[int] = None
+        self._text: List[str] = []
+        # Data between two tags; feed() may deliver it in several pieces
+        self._run: List[str] = []
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """True once the transcript grid has been fully parsed."""
+        return self._done
+
+    def read_sections(self) -> List[Tuple[str, List[str]]]:
+        """
+        Return the sections completed since the last call.
+
+        Returned sections are removed from `sections`, so a streaming caller
+        only holds the section currently being parsed.
+        """
+        end = len(self.sections)
+        if end and not self._done and (self._expect_content or self._content_depth is not None):
+            # The last speaker may still receive paragraphs
+            end -= 1
+        ready = self.sections[:end]
+        del self.sections[:end]
+        return ready
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_run()
+        if self._done or tag in self.VOID_TAGS:
+            return
+        if tag == "p" and "p" in self._stack:
+            # A new paragraph implicitly closes an unclosed one
+            self.handle_endtag("p")
+        self._stack.append(tag)
+        depth = len(self._stack)
+
+        if self._grid_depth is None:
+            classes = (dict(attrs).get("class") or "").split()
+            if tag != "div":
+                return
+            if self._annotatable_depth is None:
+                if "r6o-annotatable" in classes:
+                    self._annotatable_depth = depth
+            elif "grid" in classes:
+                self._grid_depth = depth
+            return
+
+        if depth == self._grid_depth + 1:
+            # Direct children of the grid alternate speaker h3 / content div
+            if tag == "h3":
+                self._start_capture(tag, depth)
+                self._expect_content = False
+            elif tag == "div" and self._expect_content:
+                self._content_depth = depth
+                self._expect_content = False
+            else:
+                self._expect_content = False
+        elif tag == "p" and self._content_depth is not None and self._capture_tag is None:
+            self._start_capture(tag, depth)
+
+    def handle_endtag(self, tag):
+        self._flush_run()
+        if self._done or tag not in self._stack:
+            return
+        # Pop up to the matching element, implicitly closing unclosed children
+        while self._stack:
+            depth = len(self._stack)
+            popped = self._stack.pop()
+            self._close(depth)
+            if popped == tag or self._done:
+                break
+
+    def handle_data(self, data):
+        if self._capture_tag is not None:
+            self._run.append(data)
+
+    def _flush_run(self) -> None:
+        # Each run is one text node, so stripping matches per-node get_text(strip=True)
+        if self._run:
+            self._text.append("".join(self._run))
+            self._run = []
+
+    def _start_capture(self, tag: str, depth: int) -> None:
+        self._capture_tag = tag
+        self._capture_depth = depth
+        self._text = []
+
+    def _close(self, depth: int) -> None:
+        if depth == self._capture_depth:
+            if self._capture_tag == "h3":
+                speaker = "".join(part.strip() for part in self._text)
+                self.sections.append((speaker, []))
+                self._expect_content = True
+            elif self.sections:
+                self.sections[-1][1].append("".join(self._text))
+            self._capture_tag = None
+            self._capture_depth = None
+            self._text = []
+        if depth == self._content_depth:
+            self._content_depth = None
+        if depth == self._grid_depth or (
+            depth == self._annotatable_depth and self._grid_depth is None
+        ):
+            # Only the first transcript grid is parsed
+            self._done = True
+
+
+def parse_transcript_html(html_content: str) -> List[Tuple[str, List[str]]]:
+    """
+    Parse a transcript page into speaker sections.
+
+    Args:
+        html_content: HTML of a transcript page (Transcript.transcript_url)
+
+    Returns:
+        List of (speaker, paragraphs) tuples, empty if no transcript was found
+    """
+    parser = TranscriptParser()
+    parser.feed(html_content)
+    parser.close()
+    return parser.sections
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests that set none."""
+
+    def __init__(self, *args, timeout: float = 10, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        # Session.request passes timeout=None explicitly when unset
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of JSON response bodies with per-entry expiry.
+
+    Safe to share between threads; entries outlive the process, so repeated
+    runs can skip the network for data that is still fresh.
+    """
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, expires REAL NOT NULL, body BLOB NOT NULL)"
+            )
+            self._purge_expired()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[0] < time.time():
+            return None
+        return row[1]
+
+    def set(self, key: str, body: bytes, ttl: float) -> None:
+        """Store body under key for ttl seconds, dropping any expired entries."""
+        with self._lock, self._conn:
+            self._purge_expired()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires, body) VALUES (?, ?, ?)",
+                (key, time.time() + ttl, body)
+            )
+
+    def _purge_expired(self) -> None:
+        """Delete expired rows so the file does not grow without bound (caller holds the lock)."""
+        self._conn.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+
+
 class CapEdgeClient:
     """
     Client for the CapEdge API.
@@ -67,15 +300,75 @@ class CapEdgeClient:
     """
 
     BASE_URL = "https://capedge.com/v1/api/"
+    REALTIME_URL = "https://capedge.com/company/{cik}/{ticker}/data/realtime"
+
+    # Connection pool sizing; large enough for concurrent callers to keep
+    # their connections alive instead of reconnecting per request
+    POOL_CONNECTIONS = 20
+    POOL_MAXSIZE = 50
 
-    def __init__(self, cookies: Dict[str, str]):
+    # Default timeout (seconds) for requests made through the session
+    TIMEOUT = 10
+
+    # Maximum number of distinct search queries kept in memory
+    SEARCH_CACHE_SIZE = 512
+
+    # List endpoints that change rarely; their responses are revalidated
+    # with conditional GETs instead of being downloaded again
+    CONDITIONAL_ENDPOINTS = frozenset({"transcripts", "ipos/latest"})
+
+    # Seconds that responses stay fresh in the disk cache, by endpoint;
+    # a Cache-Control max-age from the server takes precedence
+    DISK_CACHE_TTLS = {
+        "search/company": 86400,
+        "transcripts": 600,
+        "ipos/latest": 3600,
+    }
+    DISK_CACHE_DEFAULT_TTL = 300
+
+    def __init__(
+        self,
+        cookies: Dict[str, str],
+        cache_ttl: Optional[float] = None,
+        cache_path: Optional[str] = None
+    ):
         """
         Initialize the CapEdge client.
 
         Args:
             cookies: Dictionary of session cookies from capedge.com
+            cache_ttl: Seconds to cache company search results. Defaults to
+                the CAPEDGE_CACHE_TTL environment variable, or 300. Use 0 to
+                disable caching.
+            cache_path: SQLite file for a persistent response cache. Defaults
+                to the CAPEDGE_CACHE_PATH environment variable; if neither is
+                set, responses are not cached on disk.
         """
+        if cache_ttl is None:
+            cache_ttl = float(os.getenv("CAPEDGE_CACHE_TTL", "300"))
+        self.cache_ttl = cache_ttl
+        self._search_cache: "OrderedDict[str, Tuple[float, Tuple[Company, ...]]]" = OrderedDict()
+        self._search_lock = threading.Lock()
+        # (endpoint, sorted params) -> (validator headers, parsed JSON)
+        self._etag_cache: Dict[Tuple[str, Tuple], Tuple[Dict[str, str], Any]] = {}
+
+        if cache_path is None:
+            cache_path = os.getenv("CAPEDGE_CACHE_PATH")
+        self._disk_cache = ResponseCache(cache_path) if cache_path else None
+        # Disk cache keys are namespaced by session so accounts never share data
+        self._cache_namespace = hashlib.sha256(
+            "; ".join(f"{k}={v}" for k, v in sorted(cookies.items())).encode("utf-8")
+        ).hexdigest()[:16]
+
+        # BASE_URL ends in "/" and endpoints are relative, so request URLs
+        # are built by plain concatenation
+        self._base = self.BASE_URL
         self.session = requests.Session()
+        self.session.mount("https://", TimeoutHTTPAdapter(
+            timeout=self.TIMEOUT,
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+        ))
         self.session.cookies.update(cookies)
         self.session.headers.update({
             "Accept": "application/json",
@@ -83,22 +376,25 @@ class CapEdgeClient:
         })
 
     @classmethod
-    def from_cookie_string(cls, cookie_string: str) -> "CapEdgeClient":
+    def from_cookie_string(
+        cls,
+        cookie_string: str,
+        cache_ttl: Optional[float] = None,
+        cache_path: Optional[str] = None
+    ) -> "CapEdgeClient":
         """
         Create a client from a cookie string (as copied from browser DevTools).
 
         Args:
             cookie_string: Cookie header value (e.g., "name1=value1; name2=value2")
+            cache_ttl: Seconds to cache company search results (see __init__)
+            cache_path: SQLite file for a persistent response cache (see __init__)
 
         Returns:
             CapEdgeClient instance
         """
-        cookies = {}
-        for item in cookie_string.split("; "):
-            if "=" in item:
-                key, value = item.split("=", 1)
-                cookies[key] = value
-        return cls(cookies)
+        cookies = dict(_COOKIE_RE.findall(cookie_string))
+        return cls(cookies, cache_ttl=cache_ttl, cache_path=cache_path)
 
     def _request(self, endpoint: str, params: Optional[Dict] = None) -> Any:
         """
@@ -115,18 +411,82 @@ class CapEdgeClient:
             requests.HTTPError: If the request fails
             ValueError: If the response is not valid JSON
         """
-        url = urljoin(self.BASE_URL, endpoint)
-        response = self.session.get(url, params=params)
+        url = self._base + endpoint
+
+        disk_key = self._disk_cache_key(url, params)
+        if disk_key is not None:
+            body = self._disk_cache.get(disk_key)
+            if body is not None:
+                return json.loads(body)
+
+        cache_key = None
+        cached = None
+        if endpoint in self.CONDITIONAL_ENDPOINTS:
+            cache_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            cached = self._etag_cache.get(cache_key)
+
+        response = self.session.get(url, params=params, headers=cached[0] if cached else None)
+        if response.status_code == 304 and cached:
+            # Unchanged since the last fetch; reuse the parsed body
+            return cached[1]
+        data = self._parse_response(response)
+        if disk_key is not None:
+            self._disk_cache_store(
+                disk_key, response,
+                self.DISK_CACHE_TTLS.get(endpoint, self.DISK_CACHE_DEFAULT_TTL)
+            )
+
+        if cache_key is not None:
+            validators = {}
+            if "ETag" in response.headers:
+                validators["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+            if validators:
+                self._etag_cache[cache_key] = (validators, data)
+
+        return data
+
+    def _parse_response(self, response: requests.Response) -> Any:
+        """
+        Check an API response and decode its JSON body.
+
+        Raises:
+            requests.HTTPError: If the request failed
+            ValueError: If the response is not valid JSON
+        """
         response.raise_for_status()
 
-        # Check if we got HTML instead of JSON (session expired)
-        if response.text.startswith("<!DOCTYPE html>") or response.text.startswith("<html"):
+        # Check if we got HTML instead of JSON (session expired). Compare raw
+        # bytes so the body is never decoded to str just for this check.
+        if response.content.startswith((b"<!DOCTYPE html>", b"<html")):
             raise ValueError(
                 "Session expired or invalid. Please update your cookies. "
                 "Response was HTML instead of JSON."
             )
 
-        return response.json()
+        # Parse the raw bytes directly; skips requests' charset sniffing
+        return json.loads(response.content)
+
+    def _disk_cache_key(self, url: str, params: Optional[Dict] = None) -> Optional[str]:
+        """Build the disk cache key for a GET, or None if disk caching is off."""
+        if self._disk_cache is None:
+            return None
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        return f"{self._cache_namespace}:{url}"
+
+    def _disk_cache_store(self, key: str, response: requests.Response, ttl: float) -> None:
+        """Store a parsed-OK response body, honoring the server's Cache-Control."""
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control or "no-cache" in cache_control:
+            return
+        for directive in cache_control.split(","):
+            name, _, value = directive.strip().partition("=")
+            if name == "max-age" and value.isdigit():
+                ttl = int(value)
+        if ttl > 0:
+            self._disk_cache.set(key, response.content, ttl)
 
     # === Company Search ===
 
@@ -145,15 +505,113 @@ class CapEdgeClient:
             >>> for c in companies:
             ...     print(f"{c.name} ({c.ticker}) - CIK: {c.cik}")
         """
+        key = query.strip().lower()
+        cached = self._search_cache_get(key)
+        if cached is not None:
+            return list(cached)
+
         data = self._request("search/company", params={"q": query})
-        return [
+        companies = tuple(
             Company(
                 cik=item["value"],
                 name=item["label"],
                 ticker=item.get("tradingSymbol")
             )
             for item in data.get("data", [])
-        ]
+        )
+        self._search_cache_put(key, companies)
+        return list(companies)
+
+    def _search_cache_get(self, key: str) -> Optional[Tuple[Company, ...]]:
+        """Return cached search results for key, or None if missing/expired."""
+        if self.cache_ttl <= 0:
+            return None
+        with self._search_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            expires, companies = entry
+            if expires < time.monotonic():
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+            return companies
+
+    def _search_cache_put(self, key: str, companies: Tuple[Company, ...]) -> None:
+        """Store search results, evicting the least recently used entry if full."""
+        if self.cache_ttl <= 0:
+            return
+        with self._search_lock:
+            self._search_cache[key] = (time.monotonic() + self.cache_ttl, companies)
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+    # === Company Data ===
+
+    def get_company_realtime(self, cik: int, ticker: str) -> Dict[str, Any]:
+        """
+        Get realtime quote and profile data for a company.
+
+        Args:
+            cik: Company CIK number
+            ticker: Ticker symbol
+
+        Returns:
+            Dictionary with 'quote' and 'stats' sections
+
+        Raises:
+            requests.HTTPError: If the request fails
+            ValueError: If the response is not valid JSON
+
+        Example:
+            >>> data = client.get_company_realtime(320193, "AAPL")
+            >>> print(data["quote"]["data"]["latestPrice"])
+        """
+        url = self.REALTIME_URL.format(cik=cik, ticker=ticker)
+        disk_key = self._disk_cache_key(url)
+        if disk_key is not None:
+            body = self._disk_cache.get(disk_key)
+            if body is not None:
+                return json.loads(body)
+
+        response = self.session.get(url)
+        data = self._parse_response(response)
+        if disk_key is not None:
+            self._disk_cache_store(disk_key, response, self.DISK_CACHE_DEFAULT_TTL)
+        return data
+
+    def get_company_realtime_batch(
+        self,
+        companies: Iterable[Tuple[int, str]],
+        max_workers: int = 8
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get realtime data for several companies, fetching them concurrently.
+
+        Args:
+            companies: (cik, ticker) pairs
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Realtime data for each pair, in input order, or None where the
+            request failed
+
+        Example:
+            >>> results = client.get_company_realtime_batch([(320193, "AAPL"), (1318605, "TSLA")])
+        """
+        companies = list(companies)
+        if not companies:
+            return []
+
+        def fetch(pair: Tuple[int, str]) -> Optional[Dict[str, Any]]:
+            try:
+                return self.get_company_realtime(*pair)
+            except (requests.RequestException, ValueError):
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(companies))) as executor:
+            return list(executor.map(fetch, companies))
 
     # === Transcripts ===
 
@@ -184,27 +642,72 @@ class CapEdgeClient:
 
         data = self._request("transcripts", params=params)
 
-        transcripts = []
-        for item in data.get("data", []):
-            transcripts.append(Transcript(
-                id=item["id"],
-                company_name=item["company"]["name"],
-                cik=item["company"]["cik"],
-                ticker=item.get("ticker", ""),
-                year=item["year"],
-                quarter=item["quarter"],
-                title=item["title"],
-                date=item["date"],
-                transcript_url=item["transcriptUrl"],
-                exchange=item.get("exchange"),
-                market_cap=item.get("marketCap")
-            ))
-
         return {
             "total": data.get("total", 0),
-            "data": transcripts
+            "data": self._parse_transcripts(data)
         }
 
+    def get_transcripts_iter(
+        self,
+        company_id: Optional[int] = None,
+        start_page: int = 1
+    ) -> Iterator[Transcript]:
+        """
+        Iterate over transcripts page by page until the listing is exhausted.
+
+        Args:
+            company_id: Optional CIK to filter by company
+            start_page: Page number to start from (1-indexed)
+
+        Yields:
+            Transcripts in listing order
+
+        Example:
+            >>> for t in client.get_transcripts_iter(company_id=320193):
+            ...     print(t.title)
+        """
+        # One params dict reused for every page; requests encodes it into the
+        # URL immediately, so mutating it between calls is safe
+        params = {"page": start_page}
+        if company_id:
+            params["companyId"] = company_id
+
+        seen = 0
+        while True:
+            data = self._request("transcripts", params=params)
+            transcripts = self._parse_transcripts(data)
+            if not transcripts:
+                return
+            yield from transcripts
+            seen += len(transcripts)
+            total = data.get("total")
+            if start_page == 1 and total is not None and seen >= total:
+                # Everything has been listed; skip the trailing empty page
+                return
+            params["page"] += 1
+
+    @staticmethod
+    def _parse_transcripts(data: Dict[str, Any]) -> List[Transcript]:
+        """Build Transcript objects from a transcripts endpoint response."""
+        transcripts = []
+        append = transcripts.append
+        for item in data.get("data", []):
+            id_, company, year, quarter, title, date, url = _TRANSCRIPT_FIELDS(item)
+            append(Transcript(
+                id_,
+                company["name"],
+                company["cik"],
+                item.get("ticker", ""),
+                year,
+                quarter,
+                title,
+                date,
+                url,
+                item.get("exchange"),
+                item.get("marketCap")
+            ))
+        return transcripts
+
     def get_company_transcripts(self, cik: int, page: int = 1) -> Dict[str, Any]:
         """
         Get all transcripts for a specific company.
@@ -222,6 +725,84 @@ class CapEdgeClient:
         """
         return self.get_transcripts(page=page, company_id=cik)
 
+    def get_transcripts_batch(
+        self,
+        pages: Iterable[int],
+        company_id: Optional[int] = None,
+        max_workers: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Get several pages of transcripts, fetching them concurrently.
+
+        Args:
+            pages: Page numbers to fetch (e.g., range(1, 6))
+            company_id: Optional CIK to filter by company
+            max_workers: Maximum number of pages fetched at once
+
+        Returns:
+            Dictionary with 'total' count and 'data' list of transcripts,
+            concatenated in the order the pages were given
+
+        Example:
+            >>> result = client.get_transcripts_batch(range(1, 6))
+            >>> print(len(result["data"]))
+        """
+        pages = list(pages)
+        if not pages:
+            return {"total": 0, "data": []}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+            results = list(executor.map(
+                lambda page: self.get_transcripts(page=page, company_id=company_id),
+                pages
+            ))
+
+        return {
+            "total": results[0]["total"],
+            "data": [t for result in results for t in result["data"]]
+        }
+
+    def iter_transcript(
+        self,
+        transcript_url: str,
+        chunk_size: int = 65536
+    ) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Stream a transcript page and yield its speaker sections as they arrive.
+
+        The page is downloaded in chunks and parsed incrementally, so the full
+        HTML is never held in memory.
+
+        Args:
+            transcript_url: Transcript page URL (Transcript.transcript_url)
+            chunk_size: Number of bytes to read per chunk
+
+        Yields:
+            (speaker, paragraphs) tuples in page order
+
+        Raises:
+            requests.HTTPError: If the request fails
+
+        Example:
+            >>> for speaker, paragraphs in client.iter_transcript(t.transcript_url):
+            ...     print(f"[{speaker}]", len(paragraphs))
+        """
+        parser = TranscriptParser()
+        with self.session.get(transcript_url, stream=True) as response:
+            response.raise_for_status()
+            # CapEdge pages are always UTF-8. Set it explicitly: for text/html
+            # without a charset, requests would otherwise fall back to
+            # ISO-8859-1, or to charset detection when no Content-Type is sent.
+            response.encoding = "utf-8"
+            for chunk in response.iter_content(chunk_size, decode_unicode=True):
+                parser.feed(chunk)
+                yield from parser.read_sections()
+                if parser.done:
+                    # Skip downloading the rest of the page
+                    return
+        parser.close()
+        yield from parser.read_sections()
+
     # === Convenience Methods ===
 
     def get_latest_transcripts(self, limit: int = 10) -> List[Transcript]:
@@ -257,6 +838,33 @@ class CapEdgeClient:
         return None
 
 
+_default_client: Optional[CapEdgeClient] = None
+_default_client_lock = threading.Lock()
+
+
+def default_client() -> CapEdgeClient:
+    """
+    Get a shared client configured from the CAPEDGE_COOKIES environment variable.
+
+    The client is created on first use and reused afterwards, so its
+    connection pool and caches are shared by everything in the process.
+
+    Returns:
+        CapEdgeClient instance
+
+    Raises:
+        ValueError: If CAPEDGE_COOKIES is not set
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            cookies = os.getenv("CAPEDGE_COOKIES")
+            if not cookies:
+                raise ValueError("CAPEDGE_COOKIES not found in environment. Please set it in .env file.")
+            _default_client = CapEdgeClient.from_cookie_string(cookies)
+        return _default_client
+
+
 # === Example Usage ===
 
 if __name__ == "__main__":
@@ -1,18 +1,28 @@
-import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from datetime import datetime
 from dotenv import load_dotenv
-from capedge_client import CapEdgeClient
+from capedge_client import CapEdgeClient, default_client
 
 load_dotenv()
 
-COOKIES = os.getenv("CAPEDGE_COOKIES")
-if not COOKIES:
-    raise ValueError("CAPEDGE_COOKIES not found in environment. Please set it in .env file.")
+# (threshold, suffix) pairs for format_market_cap, largest first
+_MARKET_CAP_SCALES = (
+    (1_000_000_000_000, "T"),
+    (1_000_000_000, "B"),
+    (1_000_000, "M"),
+)
 
+# Trailing corporate designators ignored when comparing company names
+_NAME_SUFFIXES = frozenset({
+    "inc", "incorporated", "corp", "corporation", "co", "company",
+    "ltd", "limited", "llc", "lp", "plc",
+})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CompanyProfile:
     """Company profile data."""
     cik: int
@@ -34,7 +44,7 @@ class CompanyProfile:
 
 
 def get_latest_ipos(client: CapEdgeClient, limit: int = 10) -> list:
-    """Fetch latest IPO filings."""
+    """Fetch latest IPO filings, one per company."""
     data = client._request("ipos/latest", params={"page": 1})
     filings = [
         {
@@ -47,78 +57,108 @@ def get_latest_ipos(client: CapEdgeClient, limit: int = 10) -> list:
         for item in data.get("data", [])
         if not item.get("isFollowOn", False)  # Only IPOs, not follow-ons
     ]
-    return filings[:limit]
+    # Amended registrations (S-1/A etc.) repeat the same filer; keep the first
+    # filing per CIK in API order. Filings without a CIK are kept as-is.
+    seen = set()
+    unique = []
+    for filing in filings:
+        cik = filing["cik"]
+        if cik is not None:
+            if cik in seen:
+                continue
+            seen.add(cik)
+        unique.append(filing)
+    return unique[:limit]
+
+
+def normalize_company_name(name: str) -> str:
+    """Lowercase a company name and drop punctuation and trailing suffixes like "Inc."."""
+    words = re.sub(r"[^\w\s]", " ", name.lower()).split()
+    while words and words[-1] in _NAME_SUFFIXES:
+        words.pop()
+    return " ".join(words)
 
 
 def get_company_ticker(client: CapEdgeClient, cik: int, name: str) -> Optional[str]:
     """Get ticker symbol by searching for company name."""
     try:
-        # Use direct request with timeout instead of client method
-        resp = client.session.get(
-            "https://capedge.com/v1/api/search/company",
-            params={"q": name},
-            timeout=10
-        )
-        if resp.ok:
-            data = resp.json()
-            for item in data.get("data", []):
-                # Match by CIK to ensure we get the right company
-                if str(item.get("value")) == str(cik) and item.get("tradingSymbol"):
-                    return item["tradingSymbol"]
-                # Fallback: return first result with a ticker
-                if item.get("tradingSymbol"):
-                    return item["tradingSymbol"]
+        # The client applies a default timeout and caches repeated searches
+        companies = client.search_company(name)
     except Exception:
-        pass
+        return None
+    # Match by CIK to ensure we get the right company
+    for company in companies:
+        if str(company.cik) == str(cik) and company.ticker:
+            return company.ticker
+    # Fallback: return first result with a ticker
+    for company in companies:
+        if company.ticker:
+            return company.ticker
     return None
 
 
-def get_company_profile(client: CapEdgeClient, cik: int, ticker: str) -> Optional[CompanyProfile]:
-    """Fetch company profile from realtime data endpoint."""
-    try:
-        url = f"https://capedge.com/company/{cik}/{ticker}/data/realtime"
-        resp = client.session.get(url, timeout=10)
-        if not resp.ok:
-            return None
-
-        data = resp.json()
-        quote = data.get("quote", {}).get("data", {})
-        stats = data.get("stats", {}).get("data", {})
-
-        # Skip if no meaningful data
-        if not stats.get("Name") and not stats.get("Description"):
-            return None
-
-        return CompanyProfile(
-            cik=cik,
-            ticker=ticker,
-            name=stats.get("Name", ""),
-            description=stats.get("Description", ""),
-            exchange=stats.get("Exchange"),
-            sector=stats.get("Sector"),
-            industry=stats.get("Industry"),
-            country=stats.get("Country"),
-            address=stats.get("Address"),
-            website=stats.get("OfficialSite"),
-            market_cap=quote.get("marketCap"),
-            price=quote.get("latestPrice"),
-            pe_ratio=quote.get("peRatio"),
-            week_52_high=stats.get("week52High"),
-            week_52_low=stats.get("week52Low"),
-            shares_outstanding=stats.get("sharesOutstanding"),
-        )
-    except Exception:
+def _section_data(data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return data[key]["data"], or an empty dict if either level is missing or not a dict."""
+    section = data.get(key)
+    if not isinstance(section, dict):
+        return {}
+    inner = section.get("data")
+    return inner if isinstance(inner, dict) else {}
+
+
+def parse_company_profile(cik: int, ticker: str, data: Optional[Dict[str, Any]]) -> Optional[CompanyProfile]:
+    """Build a company profile from realtime data endpoint output."""
+    if not isinstance(data, dict):
         return None
 
+    quote = _section_data(data, "quote")
+    stats = _section_data(data, "stats")
+
+    # Skip if no meaningful data
+    if not stats.get("Name") and not stats.get("Description"):
+        return None
+
+    return CompanyProfile(
+        cik=cik,
+        ticker=ticker,
+        name=stats.get("Name", ""),
+        description=stats.get("Description", ""),
+        exchange=stats.get("Exchange"),
+        sector=stats.get("Sector"),
+        industry=stats.get("Industry"),
+        country=stats.get("Country"),
+        address=stats.get("Address"),
+        website=stats.get("OfficialSite"),
+        market_cap=quote.get("marketCap"),
+        price=quote.get("latestPrice"),
+        pe_ratio=quote.get("peRatio"),
+        week_52_high=stats.get("week52High"),
+        week_52_low=stats.get("week52Low"),
+        shares_outstanding=stats.get("sharesOutstanding"),
+    )
+
+
+def lookup_ticker(client: CapEdgeClient, ipo: dict) -> Optional[str]:
+    """Resolve the ticker for an IPO filer."""
+    name = ipo["name"]
+    cik = ipo["cik"]
+
+    # Get ticker - use short name for better search results
+    short_name = name.split(",")[0].split(" Inc")[0].split(" Corp")[0].strip()
+    ticker = get_company_ticker(client, cik, short_name)
+    if not ticker and normalize_company_name(name) != normalize_company_name(short_name):
+        # Try full name, unless it only differs by suffix/punctuation
+        ticker = get_company_ticker(client, cik, name)
+    return ticker
+
 
 def format_market_cap(value: Optional[float]) -> str:
     """Format market cap as readable string."""
     if value is None:
         return "-"
-    if value >= 1_000_000_000:
-        return f"${value / 1_000_000_000:.2f}B"
-    if value >= 1_000_000:
-        return f"${value / 1_000_000:.2f}M"
+    for threshold, suffix in _MARKET_CAP_SCALES:
+        if value >= threshold:
+            return f"${value / threshold:.2f}{suffix}"
     return f"${value:,.0f}"
 
 
@@ -130,12 +170,7 @@ def format_price(value: Optional[float]) -> str:
 
 
 def main():
-    client = CapEdgeClient.from_cookie_string(COOKIES)
-
-    # Set default timeout for all requests
-    client.session.request = lambda method, url, **kwargs: client.session.__class__.request(
-        client.session, method, url, timeout=kwargs.pop('timeout', 10), **kwargs
-    )
+    client = default_client()
 
     print("Fetching Recent IPO Company Profiles")
     print("=" * 80)
@@ -149,24 +184,28 @@ def main():
 
     profiles = []
 
-    for ipo in ipos[:15]:  # Limit to 15 to avoid too many requests
-        name = ipo["name"]
-        cik = ipo["cik"]
-
-        print(f"Looking up: {name[:50]}...", end=" ", flush=True)
+    # Limit to 15 to avoid too many requests; lookups are network-bound so
+    # run them concurrently over the shared session
+    batch = ipos[:15]
+    print(f"Looking up {len(batch)} companies...")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tickers = list(executor.map(lambda ipo: lookup_ticker(client, ipo), batch))
+
+    # Fetch all profiles in one concurrent batch
+    found = [(ipo["cik"], ticker) for ipo, ticker in zip(batch, tickers) if ticker]
+    realtime = client.get_company_realtime_batch(found)
+    found_profiles = (
+        parse_company_profile(cik, ticker, data)
+        for (cik, ticker), data in zip(found, realtime)
+    )
 
-        # Get ticker - use short name for better search results
-        short_name = name.split(",")[0].split(" Inc")[0].split(" Corp")[0].strip()
-        ticker = get_company_ticker(client, cik, short_name)
-        if not ticker:
-            # Try full name
-            ticker = get_company_ticker(client, cik, name)
+    for ipo, ticker in zip(batch, tickers):
+        print(f"  {ipo['name'][:50]}...", end=" ")
         if not ticker:
             print("(no ticker)")
             continue
-
-        # Get profile
-        profile = get_company_profile(client, cik, ticker)
+        # Profiles are in the same order as the filings that found a ticker
+        profile = next(found_profiles)
         if profile:
             profiles.append(profile)
             print(f"OK ({ticker})")
@@ -1,73 +1,68 @@
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
-import html
 
-from capedge_client import CapEdgeClient
+from capedge_client import CapEdgeClient, Transcript, default_client
 
 load_dotenv()
 
-COOKIES = os.getenv("CAPEDGE_COOKIES")
-if not COOKIES:
-    raise ValueError("CAPEDGE_COOKIES not found in environment. Please set it in .env file.")
-
 OUTPUT_DIR = Path("transcripts")
+# Plain-string form for building file paths without creating Path objects
+_OUTPUT_DIR_STR = os.fsdecode(OUTPUT_DIR)
 
 
-def parse_transcript_html(html_content: str) -> str:
-    """Parse transcript HTML and return formatted text."""
-    soup = BeautifulSoup(html_content, "html.parser")
-    lines = []
-
-    transcript_grid = soup.find("div", class_="r6o-annotatable")
-    if not transcript_grid:
-        return ""
-
-    grid_div = transcript_grid.find("div", class_="grid")
-    if not grid_div:
-        return ""
-
-    children = list(grid_div.children)
-    i = 0
-    while i < len(children):
-        child = children[i]
-        if child.name == "h3":
-            speaker = child.get_text(strip=True)
-            lines.append(f"\n[{speaker}]\n")
-            i += 1
-            if i < len(children):
-                content_div = children[i]
-                if content_div.name == "div":
-                    paragraphs = content_div.find_all("p")
-                    for p in paragraphs:
-                        text = html.unescape(p.get_text())
-                        lines.append(text)
-                i += 1
-        else:
-            i += 1
-
-    return "\n".join(lines)
+def save_transcript(client: CapEdgeClient, t: Transcript) -> str:
+    """Stream a transcript into OUTPUT_DIR and return a status message."""
+    filepath = f"{_OUTPUT_DIR_STR}/{t.ticker}_{t.year}_Q{t.quarter}.txt"
+
+    header = f"""{t.company_name} ({t.ticker})
+{t.title}
+Date: {t.date[:10]}
+Quarter: Q{t.quarter} {t.year}
+{'=' * 60}
+"""
+    f = None
+    try:
+        # Sections are written as they are parsed; the file is only created
+        # once the page turns out to contain a transcript
+        for speaker, paragraphs in client.iter_transcript(t.transcript_url):
+            if f is None:
+                f = open(filepath, "wb")
+                f.write(header.encode("utf-8"))
+                section = f"\n[{speaker}]\n"
+            else:
+                section = f"\n\n[{speaker}]\n"
+            for text in paragraphs:
+                section += "\n" + text
+            f.write(section.encode("utf-8"))
+    except Exception as e:
+        if f is not None:
+            f.close()
+            os.remove(filepath)
+        return f"ERROR ({e})"
+
+    if f is None:
+        return "SKIP (no content)"
+    f.close()
+    return f"OK -> {filepath}"
 
 
 def main():
-    client = CapEdgeClient.from_cookie_string(COOKIES)
+    client = default_client()
 
     OUTPUT_DIR.mkdir(exist_ok=True)
 
-    cutoff = datetime.now() - timedelta(hours=24)
-    print(f"Fetching transcripts from the last 24 hours (since {cutoff.strftime('%Y-%m-%d %H:%M')})")
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+    # API dates are ISO-8601 UTC ("...Z"), which sort lexicographically
+    cutoff_iso = cutoff.strftime("%Y-%m-%dT%H:%M:%S")
+    print(f"Fetching transcripts from the last 24 hours (since {cutoff.astimezone().strftime('%Y-%m-%d %H:%M')})")
     print("=" * 70)
     print()
 
     result = client.get_transcripts(page=1)
-    recent = []
-
-    for t in result["data"]:
-        transcript_date = datetime.fromisoformat(t.date.replace("Z", "+00:00"))
-        if transcript_date.replace(tzinfo=None) >= cutoff:
-            recent.append(t)
+    recent = [t for t in result["data"] if t.date >= cutoff_iso]
 
     if not recent:
         print("No transcripts found in the last 24 hours.")
@@ -83,36 +78,12 @@ def main():
     print("Fetching and saving transcripts...")
     print()
 
-    for t in recent:
-        filename = f"{t.ticker}_{t.year}_Q{t.quarter}.txt"
-        filepath = OUTPUT_DIR / filename
-
-        print(f"  Fetching {t.ticker} Q{t.quarter} {t.year}...", end=" ", flush=True)
-
-        try:
-            response = client.session.get(t.transcript_url)
-            response.raise_for_status()
-
-            transcript_text = parse_transcript_html(response.text)
-
-            if not transcript_text:
-                print("SKIP (no content)")
-                continue
-
-            header = f"""{t.company_name} ({t.ticker})
-{t.title}
-Date: {t.date[:10]}
-Quarter: Q{t.quarter} {t.year}
-{'=' * 60}
-"""
-            with open(filepath, "w") as f:
-                f.write(header)
-                f.write(transcript_text)
-
-            print(f"OK -> {filepath}")
-
-        except Exception as e:
-            print(f"ERROR ({e})")
+    # Download, parse and save concurrently; report results in listing order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tasks = [(t, executor.submit(save_transcript, client, t)) for t in recent]
+        for t, future in tasks:
+            print(f"  Fetching {t.ticker} Q{t.quarter} {t.year}...", end=" ", flush=True)
+            print(future.result())
 
     print()
     print(f"Done. Transcripts saved to {OUTPUT_DIR}/")
@@ -1,15 +1,8 @@
-import os
 from dotenv import load_dotenv
-from capedge_client import CapEdgeClient
-from bs4 import BeautifulSoup
-import html
+from capedge_client import default_client
 
 load_dotenv()
 
-COOKIES = os.getenv("CAPEDGE_COOKIES")
-if not COOKIES:
-    raise ValueError("CAPEDGE_COOKIES not found in environment. Please set it in .env file.")
-
 # ticker = "SKYT"
 # company_name = "SkyWater"
 
@@ -17,7 +10,7 @@ ticker = "RKLB"
 company_name = "Rocket Lab"
 
 def main():
-    client = CapEdgeClient.from_cookie_string(COOKIES)
+    client = default_client()
 
     # Find company CIK
     print(f"Searching for {ticker}...")
@@ -54,46 +47,23 @@ def main():
     print(f"  Transcript URL: {latest.transcript_url}")
     print()
 
-    # Fetch the transcript page and parse the HTML
+    # Stream the transcript page, printing each speaker as it is parsed
     print("Fetching transcript content...")
-    response = client.session.get(latest.transcript_url)
-    response.raise_for_status()
-
-    soup = BeautifulSoup(response.text, "html.parser")
 
     print("\n" + "=" * 60)
     print("TRANSCRIPT CONTENT")
     print("=" * 60)
 
-    # Find the Call transcript section
     # The transcript is in a grid layout with speaker names (h3) and their text (div with p tags)
-    transcript_grid = soup.find("div", class_="r6o-annotatable")
-
-    if transcript_grid:
-        grid_div = transcript_grid.find("div", class_="grid")
-        if grid_div:
-            children = list(grid_div.children)
-            i = 0
-            while i < len(children):
-                child = children[i]
-                if child.name == "h3":
-                    # Speaker name
-                    speaker = child.get_text(strip=True)
-                    print(f"\n[{speaker}]")
-                    i += 1
-                    # Next element should be the content div
-                    if i < len(children):
-                        content_div = children[i]
-                        if content_div.name == "div":
-                            paragraphs = content_div.find_all("p")
-                            for p in paragraphs:
-                                text = html.unescape(p.get_text())
-                                print(text)
-                                print()
-                        i += 1
-                else:
-                    i += 1
-    else:
+    found = False
+    for speaker, paragraphs in client.iter_transcript(latest.transcript_url):
+        found = True
+        print(f"\n[{speaker}]")
+        for text in paragraphs:
+            print(text)
+            print()
+
+    if not found:
         print("Could not find transcript content in the page")
 
 
@@ -1,18 +1,13 @@
-import os
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from dotenv import load_dotenv
-from capedge_client import CapEdgeClient
+from capedge_client import CapEdgeClient, default_client
 
 load_dotenv()
 
-COOKIES = os.getenv("CAPEDGE_COOKIES")
-if not COOKIES:
-    raise ValueError("CAPEDGE_COOKIES not found in environment. Please set it in .env file.")
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IPOFiling:
     """IPO/Follow-On registration filing."""
     id: str
@@ -56,7 +51,7 @@ def format_date(iso_date: str) -> str:
 
 
 def main():
-    client = CapEdgeClient.from_cookie_string(COOKIES)
+    client = default_client()
 
     print("Latest IPO & Follow-On Filings")
     print("=" * 90)
@@ -1,16 +1,11 @@
-import os
 from dotenv import load_dotenv
-from capedge_client import CapEdgeClient
+from capedge_client import default_client
 
 load_dotenv()
 
-COOKIES = os.getenv("CAPEDGE_COOKIES")
-if not COOKIES:
-    raise ValueError("CAPEDGE_COOKIES not found in environment. Please set it in .env file.")
-
 
 def main():
-    client = CapEdgeClient.from_cookie_string(COOKIES)
+    client = default_client()
 
     print("Latest Earnings Call Transcripts")
     print("=" * 60)
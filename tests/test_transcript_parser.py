@@ -0,0 +1,43 @@
+from capedge_client import TranscriptParser, parse_transcript_html
+
+PAGE = (
+    '<html><body>'
+    '<div class="grid"><h3>Not the transcript</h3></div>'
+    '<div class="content r6o-annotatable"><div class="grid">'
+    '<h3>Tim Cook</h3>'
+    '<div><p>Thanks &amp; welcome, everyone.</p>'
+    '<div class="quote"><p>Revenue grew 8% year over year.</p></div></div>'
+    '<h3>Luca Maestri</h3>'
+    '<div><p>Thank you, Tim.</p></div>'
+    '</div></div>'
+    '</body></html>'
+)
+
+EXPECTED = [
+    ("Tim Cook", ["Thanks & welcome, everyone.", "Revenue grew 8% year over year."]),
+    ("Luca Maestri", ["Thank you, Tim."]),
+]
+
+
+def parse_in_chunks(html: str, size: int) -> list:
+    parser = TranscriptParser()
+    sections = []
+    for i in range(0, len(html), size):
+        parser.feed(html[i:i + size])
+        sections.extend(parser.read_sections())
+    parser.close()
+    sections.extend(parser.read_sections())
+    return sections
+
+
+def test_parse_whole_page():
+    assert parse_transcript_html(PAGE) == EXPECTED
+
+
+def test_parse_without_transcript():
+    assert parse_transcript_html("<html><body><p>Sign in</p></body></html>") == []
+
+
+def test_chunked_feed_matches_whole_page():
+    for size in range(1, len(PAGE)):
+        assert parse_in_chunks(PAGE, size) == EXPECTED, f"chunk size {size}"